@@ -18,7 +18,11 @@ from openai import AsyncOpenAI
 
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+
+# Number of tool results from earlier turns resent verbatim to the model;
+# older ones are replaced by a short placeholder to keep the request payload
+# small. Results from the current turn are always sent in full.
+MAX_FULL_TOOL_RESULTS = 3
 
 
 class OpenAIAgentExecutor(AgentExecutor):
@@ -33,6 +37,12 @@ class OpenAIAgentExecutor(AgentExecutor):
     ):
         self._card = card
         self.tools = tools
+        # Resolve tool methods once; the toolset does not change per request.
+        self._resolved_tools = {
+            name: getattr(instance, name)
+            for name, instance in tools.items()
+            if hasattr(instance, name)
+        }
         self.client = AsyncOpenAI(
             api_key=api_key,
             base_url='https://openrouter.ai/api/v1',
@@ -44,6 +54,24 @@ class OpenAIAgentExecutor(AgentExecutor):
         self.model = 'anthropic/claude-3.5-sonnet'
         self.system_prompt = system_prompt
 
+        # Convert tools to OpenAI format once; they are identical for every
+        # request, as are the remaining completion arguments.
+        self._openai_tools = [
+            {
+                'type': 'function',
+                'function': self._extract_function_schema(func),
+            }
+            for func in self._resolved_tools.values()
+        ]
+        self._common_kwargs = {
+            'model': self.model,
+            'tools': self._openai_tools or None,
+            'tool_choice': 'auto' if self._openai_tools else None,
+            'temperature': 0.1,
+            'max_tokens': 4000,
+        }
+        self._system_message = {'role': 'system', 'content': system_prompt}
+
     async def _process_request(
         self,
         message_text: str,
@@ -51,19 +79,10 @@ class OpenAIAgentExecutor(AgentExecutor):
         task_updater: TaskUpdater,
     ) -> None:
         messages = [
-            {'role': 'system', 'content': self.system_prompt},
+            self._system_message,
             {'role': 'user', 'content': message_text},
         ]
 
-        # Convert tools to OpenAI format
-        openai_tools = []
-        for tool_name, tool_instance in self.tools.items():
-            if hasattr(tool_instance, tool_name):
-                func = getattr(tool_instance, tool_name)
-                # Extract function schema from the method
-                schema = self._extract_function_schema(func)
-                openai_tools.append({'type': 'function', 'function': schema})
-
         max_iterations = 10
         iteration = 0
 
@@ -73,24 +92,14 @@ class OpenAIAgentExecutor(AgentExecutor):
             try:
                 # Make API call to OpenAI
                 response = await self.client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    tools=openai_tools if openai_tools else None,
-                    tool_choice='auto' if openai_tools else None,
-                    temperature=0.1,
-                    max_tokens=4000,
+                    messages=messages, **self._common_kwargs
                 )
 
                 message = response.choices[0].message
 
-                # Add assistant's response to messages
-                messages.append(
-                    {
-                        'role': 'assistant',
-                        'content': message.content,
-                        'tool_calls': message.tool_calls,
-                    }
-                )
+                # Add assistant's response to messages, serialized once so
+                # later iterations do not re-dump the SDK objects.
+                messages.append(message.model_dump(exclude_none=True))
 
                 # Check if there are tool calls to execute
                 if message.tool_calls:
@@ -100,20 +109,19 @@ class OpenAIAgentExecutor(AgentExecutor):
                         function_args = json.loads(tool_call.function.arguments)
 
                         logger.debug(
-                            f'Calling function: {function_name} with args: {function_args}'
+                            'Calling function: %s with args: %s',
+                            function_name,
+                            function_args,
                         )
 
                         # Execute the function
-                        if function_name in self.tools:
-                            tool_instance = self.tools[function_name]
-                            # Get the method from the instance
-                            if hasattr(tool_instance, function_name):
-                                method = getattr(tool_instance, function_name)
-                                result = method(**function_args)
-                            else:
-                                result = {
-                                    'error': f'Method {function_name} not found on tool instance'
-                                }
+                        method = self._resolved_tools.get(function_name)
+                        if method is not None:
+                            result = method(**function_args)
+                        elif function_name in self.tools:
+                            result = {
+                                'error': f'Method {function_name} not found on tool instance'
+                            }
                         else:
                             result = {
                                 'error': f'Function {function_name} not found'
@@ -139,6 +147,8 @@ class OpenAIAgentExecutor(AgentExecutor):
                             }
                         )
 
+                    self._trim_tool_results(messages)
+
                     # Send update to show we're processing
                     await task_updater.update_status(
                         TaskState.working,
@@ -152,13 +162,13 @@ class OpenAIAgentExecutor(AgentExecutor):
                 # No more tool calls, this is the final response
                 if message.content:
                     parts = [TextPart(text=message.content)]
-                    logger.debug(f'Yielding final response: {parts}')
+                    logger.debug('Yielding final response: %s', parts)
                     await task_updater.add_artifact(parts)
                     await task_updater.complete()
                 break
 
             except Exception as e:
-                logger.error(f'Error in OpenAI API call: {e}')
+                logger.error('Error in OpenAI API call: %s', e)
                 error_parts = [
                     TextPart(
                         text=f'Sorry, an error occurred while processing the request: {e!s}'
@@ -177,6 +187,25 @@ class OpenAIAgentExecutor(AgentExecutor):
             await task_updater.add_artifact(error_parts)
             await task_updater.complete()
 
+    def _trim_tool_results(self, messages: list[dict[str, Any]]) -> None:
+        """Replace older tool results with a size placeholder.
+
+        Only results from turns before the latest assistant message are
+        trimmed, so the model always sees every result of its current calls.
+        """
+        last_assistant = max(
+            (i for i, m in enumerate(messages) if m.get('role') == 'assistant'),
+            default=0,
+        )
+        earlier = [
+            m for m in messages[:last_assistant] if m.get('role') == 'tool'
+        ]
+        for message in earlier[:-MAX_FULL_TOOL_RESULTS]:
+            content = message['content']
+            if not content.startswith('<omitted '):
+                size = len(content.encode())
+                message['content'] = f'<omitted {size} bytes>'
+
     def _extract_function_schema(self, func):
         """Extract OpenAI function schema from a Python function"""
         import inspect
@@ -244,10 +273,11 @@ class OpenAIAgentExecutor(AgentExecutor):
         await updater.start_work()
 
         # Extract text from message parts
-        message_text = ''
-        for part in context.message.parts:
-            if isinstance(part.root, TextPart):
-                message_text += part.root.text
+        message_text = ''.join(
+            part.root.text
+            for part in context.message.parts
+            if isinstance(part.root, TextPart)
+        )
 
         await self._process_request(message_text, context, updater)
         logger.debug('[GitHub Agent] execute exiting')
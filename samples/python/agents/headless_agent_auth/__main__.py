@@ -6,6 +6,7 @@ import sys
 
 import click
 import uvicorn
+import uvloop
 
 from dotenv import load_dotenv
 
@@ -24,7 +25,7 @@ from a2a.types import (
     # OAuth2SecurityScheme,
     # OAuthFlows,
 )
-from agent import HRAgent
+from agent import HRAgent, hr_api_client
 from agent_executor import HRAgentExecutor
 from api import hr_api
 from oauth2_middleware import OAuth2Middleware
@@ -40,12 +41,17 @@ logger = logging.getLogger()
 @click.option('--port_api', default=10051)
 def main(host: str, port_agent: int, port_api: int):
     async def run_all():
-        await asyncio.gather(
-            start_agent(host, port_agent),
-            start_api(host, port_api),
-        )
+        try:
+            await asyncio.gather(
+                start_agent(host, port_agent),
+                start_api(host, port_api),
+            )
+        finally:
+            await hr_api_client.aclose()
 
-    asyncio.run(run_all())
+    # uvicorn's `loop` setting only applies to Server.run(); both servers
+    # share this loop, so run it on uvloop directly.
+    uvloop.run(run_all())
 
 
 async def start_agent(host: str, port):
@@ -116,13 +122,15 @@ async def start_agent(host: str, port):
     )
 
     logger.info(f'Starting HR Agent server on {host}:{port}')
-    await uvicorn.Server(uvicorn.Config(app=app, host=host, port=port)).serve()
+    await uvicorn.Server(
+        uvicorn.Config(app=app, host=host, port=port, http='httptools')
+    ).serve()
 
 
 async def start_api(host: str, port):
     logger.info(f'Starting HR API server on {host}:{port}')
     await uvicorn.Server(
-        uvicorn.Config(app=hr_api, host=host, port=port)
+        uvicorn.Config(app=hr_api, host=host, port=port, http='httptools')
     ).serve()
 
 
@@ -1,6 +1,12 @@
+import asyncio
 import os
+import random
+import threading
+import time
 
+from collections import OrderedDict
 from collections.abc import AsyncIterable
+from functools import lru_cache
 from typing import Any, Literal
 
 import httpx
@@ -12,9 +18,8 @@ from auth0_ai_langchain.ciba import get_ciba_credentials
 from langchain_core.messages import AIMessage, ToolMessage
 from langchain_core.runnables.config import RunnableConfig
 from langchain_core.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.checkpoint.memory import MemorySaver
-from langgraph.prebuilt import create_react_agent
+from langgraph.errors import GraphBubbleUp
 from pydantic import BaseModel
 
 
@@ -43,6 +48,64 @@ get_token = GetToken(
 )
 
 
+# Cached Auth0 Management API token, refreshed shortly before it expires.
+_management_token: dict[str, Any] = {'access_token': None, 'expires_at': 0.0}
+_management_token_lock = threading.Lock()
+
+
+def _get_management_token() -> str:
+    with _management_token_lock:
+        if time.monotonic() >= _management_token['expires_at'] - 60:
+            token = get_token.client_credentials(
+                f'https://{os.getenv("HR_AUTH0_DOMAIN")}/api/v2/'
+            )
+            _management_token['access_token'] = token['access_token']
+            _management_token['expires_at'] = time.monotonic() + token.get(
+                'expires_in', 0
+            )
+        return _management_token['access_token']
+
+
+# Management API client, rebuilt only when the cached token rotates.
+_management_client: Auth0 | None = None
+_management_client_token: str | None = None
+
+
+def _get_management_client() -> Auth0:
+    global _management_client, _management_client_token
+    token = _get_management_token()
+    if _management_client is None or token != _management_client_token:
+        _management_client = Auth0(domain=get_token.domain, token=token)
+        _management_client_token = token
+    return _management_client
+
+
+# Shared client so HR API calls reuse pooled keep-alive connections.
+hr_api_client = httpx.AsyncClient(
+    base_url=os.getenv('HR_API_BASE_URL', 'http://localhost:10051'),
+    timeout=httpx.Timeout(5.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+# Bounds concurrent HR API requests so parallel and batched lookups do not
+# trip its rate limits; 429/5xx responses are retried with jittered backoff.
+hr_api_semaphore = asyncio.Semaphore(
+    int(os.getenv('HR_API_MAX_CONCURRENCY', '16'))
+)
+HR_API_MAX_ATTEMPTS = 3
+
+
+async def _get_from_hr_api(url: str, headers: dict[str, str]) -> httpx.Response:
+    for attempt in range(HR_API_MAX_ATTEMPTS):
+        async with hr_api_semaphore:
+            response = await hr_api_client.get(url, headers=headers)
+        if response.status_code != 429 and response.status_code < 500:
+            break
+        if attempt < HR_API_MAX_ATTEMPTS - 1:
+            await asyncio.sleep(random.uniform(0, 0.5 * 2**attempt))
+    return response
+
+
 @tool
 async def is_active_employee(employee_id: str) -> dict[str, Any]:
     """Confirm whether a person is an active employee of the company.
@@ -55,8 +118,8 @@ async def is_active_employee(employee_id: str) -> dict[str, Any]:
     """
     try:
         credentials = get_ciba_credentials()
-        response = await httpx.AsyncClient().get(
-            f'{os.getenv("HR_API_BASE_URL", "http://localhost:10051")}/employees/{employee_id}',
+        response = await _get_from_hr_api(
+            f'/employees/{employee_id}',
             headers={
                 'Authorization': f'{credentials["token_type"]} {credentials["access_token"]}',
                 'Content-Type': 'application/json',
@@ -74,6 +137,42 @@ async def is_active_employee(employee_id: str) -> dict[str, Any]:
         return {'error': 'Unexpected response from HR API.'}
 
 
+confirmed_is_active_employee = with_async_user_confirmation(is_active_employee)
+
+
+@tool
+async def batch_is_active_employee(
+    employee_ids: list[str], config: RunnableConfig
+) -> list[dict[str, Any]]:
+    """Confirm whether several people are active employees of the company.
+
+    Args:
+        employee_ids (list[str]): The employees' identifications.
+        config (RunnableConfig): The tool's run config, passed on to each
+            confirmed lookup so its CIBA request belongs to the same thread.
+
+    Returns:
+        list: One employment status (or error message) per employee ID, in the same order.
+    """
+    # Each employee still approves their own CIBA request. The confirmed
+    # lookups share the tool's config, and so its thread checkpoint and
+    # interrupt, so they run one after another rather than concurrently.
+    results: list[dict[str, Any]] = []
+    for employee_id in employee_ids:
+        try:
+            result = await confirmed_is_active_employee.ainvoke(
+                {'employee_id': employee_id}, config
+            )
+        except GraphBubbleUp:
+            # CIBA outcomes (denied, expired, pending) are graph interrupts;
+            # let them stop the graph as they do for a single lookup.
+            raise
+        except Exception as e:
+            result = {'error': str(e)}
+        results.append({'employee_id': employee_id, **result})
+    return results
+
+
 @tool
 def get_employee_id_by_email(work_email: str) -> dict[str, Any] | None:
     """Return the employee ID by email.
@@ -85,12 +184,7 @@ def get_employee_id_by_email(work_email: str) -> dict[str, Any] | None:
         dict: A dictionary containing the employee ID if it exists, otherwise None.
     """
     try:
-        user = Auth0(
-            domain=get_token.domain,
-            token=get_token.client_credentials(
-                f'https://{os.getenv("HR_AUTH0_DOMAIN")}/api/v2/'
-            )['access_token'],
-        ).users_by_email.search_users_by_email(
+        user = _get_management_client().users_by_email.search_users_by_email(
             email=work_email, fields=['user_id']
         )[0]
 
@@ -99,6 +193,28 @@ def get_employee_id_by_email(work_email: str) -> dict[str, Any] | None:
         return {'error': 'Unexpected response from Auth0 Management API.'}
 
 
+class BoundedMemorySaver(MemorySaver):
+    """In-memory checkpointer that only keeps the most recently used threads."""
+
+    def __init__(self, max_threads: int = 10_000):
+        super().__init__()
+        self.max_threads = max_threads
+        self._threads: OrderedDict[str, None] = OrderedDict()
+        self._threads_lock = threading.Lock()
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        thread_id = config['configurable']['thread_id']
+        with self._threads_lock:
+            self._threads[thread_id] = None
+            self._threads.move_to_end(thread_id)
+            evicted = []
+            while len(self._threads) > self.max_threads:
+                evicted.append(self._threads.popitem(last=False)[0])
+        for evicted_thread_id in evicted:
+            self.delete_thread(evicted_thread_id)
+        return super().put(config, checkpoint, metadata, new_versions)
+
+
 class ResponseFormat(BaseModel):
     """Respond to the user in this format."""
 
@@ -108,6 +224,26 @@ class ResponseFormat(BaseModel):
     message: str
 
 
+@lru_cache(maxsize=1024)
+def _config_for(context_id: str) -> RunnableConfig:
+    # LangGraph copies the config before using it, so sharing it is safe.
+    return {'configurable': {'thread_id': context_id}}
+
+
+# Progress events yielded while the graph runs. Each caller gets its own copy,
+# so a consumer that changes one can't affect later streams.
+LOOKING_UP_EVENT: dict[str, Any] = {
+    'is_task_complete': False,
+    'task_state': 'working',
+    'content': 'Looking up the employment status...',
+}
+PROCESSING_EVENT: dict[str, Any] = {
+    'is_task_complete': False,
+    'task_state': 'working',
+    'content': 'Processing the employment status...',
+}
+
+
 class HRAgent:
     SUPPORTED_CONTENT_TYPES = ['text', 'text/plain']
 
@@ -116,6 +252,7 @@ class HRAgent:
         'Do not attempt to answer unrelated questions or use tools for other purposes.'
         "If you are asked about a person's employee status using their employee ID, use the `is_active_employee` tool."
         'If they provide a work email instead, first call the `get_employee_id_by_email` tool to get the employee ID, and then use `is_active_employee`.'
+        'When asked about several people, request all independent lookups in the same turn instead of one at a time, and use the `batch_is_active_employee` tool to check the status of more than one employee ID at once.'
     )
 
     RESPONSE_FORMAT_INSTRUCTION: str = (
@@ -126,22 +263,28 @@ class HRAgent:
     )
 
     def __init__(self):
+        # Imported here so modules that only need the tools (or the CLI
+        # before an agent is built) do not pay for the model/graph stack.
+        from langchain_google_genai import ChatGoogleGenerativeAI
+        from langgraph.prebuilt import create_react_agent
+
         self.model = ChatGoogleGenerativeAI(model='gemini-2.0-flash')
         self.tools = [
             get_employee_id_by_email,
-            with_async_user_confirmation(is_active_employee),
+            confirmed_is_active_employee,
+            batch_is_active_employee,
         ]
 
         self.graph = create_react_agent(
             self.model,
             tools=self.tools,
-            checkpointer=MemorySaver(),
+            checkpointer=BoundedMemorySaver(),
             prompt=self.SYSTEM_INSTRUCTION,
             response_format=(self.RESPONSE_FORMAT_INSTRUCTION, ResponseFormat),
         )
 
     async def invoke(self, query: str, context_id: str) -> dict[str, Any]:
-        config: RunnableConfig = {'configurable': {'thread_id': context_id}}
+        config = _config_for(context_id)
         await self.graph.ainvoke({'messages': [('user', query)]}, config)
         return self.get_agent_response(config)
 
@@ -149,29 +292,19 @@ class HRAgent:
         self, query: str, context_id: str
     ) -> AsyncIterable[dict[str, Any]]:
         inputs: dict[str, Any] = {'messages': [('user', query)]}
-        config: RunnableConfig = {'configurable': {'thread_id': context_id}}
+        config = _config_for(context_id)
 
         async for item in self.graph.astream(
             inputs, config, stream_mode='values'
         ):
-            message = item['messages'][-1] if 'messages' in item else None
-            if message:
-                if (
-                    isinstance(message, AIMessage)
-                    and message.tool_calls
-                    and len(message.tool_calls) > 0
-                ):
-                    yield {
-                        'is_task_complete': False,
-                        'task_state': 'working',
-                        'content': 'Looking up the employment status...',
-                    }
-                elif isinstance(message, ToolMessage):
-                    yield {
-                        'is_task_complete': False,
-                        'task_state': 'working',
-                        'content': 'Processing the employment status...',
-                    }
+            messages = item.get('messages')
+            if not messages:
+                continue
+            message = messages[-1]
+            if isinstance(message, AIMessage) and message.tool_calls:
+                yield dict(LOOKING_UP_EVENT)
+            elif isinstance(message, ToolMessage):
+                yield dict(PROCESSING_EVENT)
 
         yield self.get_agent_response(config)
 
@@ -1,5 +1,7 @@
+import hashlib
 import json
 import os
+import time
 
 from a2a.types import AgentCard
 from auth0_api_python import ApiClient, ApiClientOptions
@@ -16,6 +18,8 @@ api_client = ApiClient(
     )
 )
 
+MAX_CACHED_TOKENS = 10_000
+
 
 class OAuth2Middleware(BaseHTTPMiddleware):
     """Starlette middleware that authenticates A2A access using an OAuth2 bearer token."""
@@ -29,6 +33,9 @@ class OAuth2Middleware(BaseHTTPMiddleware):
         super().__init__(app)
         self.agent_card = agent_card
         self.public_paths = set(public_paths or [])
+        # Verified token payloads keyed by the SHA-256 of the bearer token,
+        # kept until the token's own `exp` claim.
+        self._token_cache: dict[bytes, tuple[float, dict]] = {}
 
         # Process the AgentCard to identify what (if any) Security Requirements are defined at the root of the
         # AgentCard, indicating agent-level authentication/authorization.
@@ -43,7 +50,7 @@ class OAuth2Middleware(BaseHTTPMiddleware):
             )
             if 'scopes' in credentials:
                 self.a2a_auth = {
-                    'required_scopes': credentials['scopes'].keys()
+                    'required_scopes': frozenset(credentials['scopes'])
                 }
 
         # # Process the Security Requirements Object
@@ -82,22 +89,18 @@ class OAuth2Middleware(BaseHTTPMiddleware):
                 'Missing or malformed Authorization header.', request
             )
 
-        access_token = auth_header.split('Bearer ')[1]
+        access_token = auth_header.removeprefix('Bearer ')
 
         try:
             if self.a2a_auth:
-                payload = await api_client.verify_access_token(
-                    access_token=access_token
+                payload = await self._verify_access_token(access_token)
+                missing_scopes = self.a2a_auth['required_scopes'].difference(
+                    payload.get('scope', '').split()
                 )
-                scopes = payload.get('scope', '').split()
-                missing_scopes = [
-                    s
-                    for s in self.a2a_auth['required_scopes']
-                    if s not in scopes
-                ]
                 if missing_scopes:
                     return self._forbidden(
-                        f'Missing required scopes: {missing_scopes}', request
+                        f'Missing required scopes: {sorted(missing_scopes)}',
+                        request,
                     )
 
         except Exception as e:
@@ -105,26 +108,46 @@ class OAuth2Middleware(BaseHTTPMiddleware):
 
         return await call_next(request)
 
-    def _forbidden(self, reason: str, request: Request):
-        accept_header = request.headers.get('accept', '')
-        if 'text/event-stream' in accept_header:
-            return PlainTextResponse(
-                f'error forbidden: {reason}',
-                status_code=403,
-                media_type='text/event-stream',
-            )
-        return JSONResponse(
-            {'error': 'forbidden', 'reason': reason}, status_code=403
+    async def _verify_access_token(self, access_token: str) -> dict:
+        key = hashlib.sha256(access_token.encode()).digest()
+        now = time.time()
+        cached = self._token_cache.get(key)
+        if cached:
+            if now < cached[0]:
+                return cached[1]
+            del self._token_cache[key]
+
+        payload = await api_client.verify_access_token(
+            access_token=access_token
         )
+        if 'exp' in payload:
+            if len(self._token_cache) >= MAX_CACHED_TOKENS:
+                self._evict_expired_tokens(now)
+            self._token_cache[key] = (payload['exp'], payload)
+        return payload
+
+    def _evict_expired_tokens(self, now: float):
+        for key, (exp, _) in list(self._token_cache.items()):
+            if now >= exp:
+                del self._token_cache[key]
+        if len(self._token_cache) >= MAX_CACHED_TOKENS:
+            self._token_cache.clear()
+
+    def _forbidden(self, reason: str, request: Request):
+        return self._error_response('forbidden', 403, reason, request)
 
     def _unauthorized(self, reason: str, request: Request):
-        accept_header = request.headers.get('accept', '')
-        if 'text/event-stream' in accept_header:
+        return self._error_response('unauthorized', 401, reason, request)
+
+    def _error_response(
+        self, error: str, status_code: int, reason: str, request: Request
+    ):
+        if 'text/event-stream' in request.headers.get('accept', ''):
             return PlainTextResponse(
-                f'error unauthorized: {reason}',
-                status_code=401,
+                f'error {error}: {reason}',
+                status_code=status_code,
                 media_type='text/event-stream',
             )
         return JSONResponse(
-            {'error': 'unauthorized', 'reason': reason}, status_code=401
+            {'error': error, 'reason': reason}, status_code=status_code
         )
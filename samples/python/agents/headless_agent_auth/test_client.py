@@ -1,6 +1,8 @@
 import asyncio
 import json
 import os
+import threading
+import time
 
 from typing import Any
 from urllib.parse import urlparse
@@ -29,7 +31,14 @@ from dotenv import load_dotenv
 
 
 load_dotenv()
-access_token = None
+
+# Agent access token, refreshed shortly before it expires.
+_token: dict[str, Any] = {'value': None, 'exp': 0.0}
+_token_lock = threading.Lock()
+
+A2A_CLIENT_AUTH0_CLIENT_ID = os.getenv('A2A_CLIENT_AUTH0_CLIENT_ID')
+A2A_CLIENT_AUTH0_CLIENT_SECRET = os.getenv('A2A_CLIENT_AUTH0_CLIENT_SECRET')
+HR_AGENT_AUTH0_AUDIENCE = os.getenv('HR_AGENT_AUTH0_AUDIENCE')
 
 
 class AgentAuth(httpx.Auth):
@@ -38,34 +47,49 @@ class AgentAuth(httpx.Auth):
     def __init__(self, agent_card: AgentCard):
         self.agent_card = agent_card
 
-    def auth_flow(self, request):
-        global access_token
-        auth = self.agent_card.authentication
+        # Resolve the auth requirements once rather than on every request.
+        auth = agent_card.authentication
+        self._token_url = (
+            json.loads(auth.credentials)['tokenUrl']
+            if auth and auth.credentials
+            else None
+        )
+        self._uses_oauth2 = bool(auth) and any(
+            scheme.lower() == 'oauth2' for scheme in auth.schemes
+        )
+        self._get_token = (
+            GetToken(
+                domain=urlparse(self._token_url).hostname,
+                client_id=A2A_CLIENT_AUTH0_CLIENT_ID,
+                client_secret=A2A_CLIENT_AUTH0_CLIENT_SECRET,
+            )
+            if self._token_url
+            else None
+        )
 
+    def auth_flow(self, request):
         # skip if not using oauth2 or credentials details are missing
-        if not (
-            any(scheme.lower() == 'oauth2' for scheme in auth.schemes)
-            and auth.credentials
-        ):
+        if not (self._uses_oauth2 and self._token_url):
             yield request
             return
 
-        if not access_token:
-            token_url = json.loads(auth.credentials)['tokenUrl']
-            print(f'\nFetching agent access token from {token_url}...')
-            get_token = GetToken(
-                domain=urlparse(token_url).hostname,
-                client_id=os.getenv('A2A_CLIENT_AUTH0_CLIENT_ID'),
-                client_secret=os.getenv('A2A_CLIENT_AUTH0_CLIENT_SECRET'),
-            )
-            access_token = get_token.client_credentials(
-                os.getenv('HR_AGENT_AUTH0_AUDIENCE')
-            )['access_token']
-            print('Done.\n')
-
-        request.headers['Authorization'] = f'Bearer {access_token}'
+        request.headers['Authorization'] = f'Bearer {self._access_token()}'
         yield request
 
+    def _access_token(self) -> str:
+        with _token_lock:
+            if time.monotonic() > _token['exp'] - 60:
+                print(
+                    f'\nFetching agent access token from {self._token_url}...'
+                )
+                response = self._get_token.client_credentials(
+                    HR_AGENT_AUTH0_AUDIENCE
+                )
+                _token['value'] = response['access_token']
+                _token['exp'] = time.monotonic() + response.get('expires_in', 0)
+                print('Done.\n')
+            return _token['value']
+
 
 @click.command()
 @click.option('--agent', default='http://localhost:10050')
@@ -73,7 +97,11 @@ class AgentAuth(httpx.Auth):
 @click.option('--history', default=False, is_flag=True)
 @click.option('--debug', default=False, is_flag=True)
 async def cli(agent: str, context_id: str | None, history: bool, debug: bool):
-    async with httpx.AsyncClient() as httpx_client:
+    async with httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        timeout=httpx.Timeout(30.0, read=None),
+    ) as httpx_client:
         agent_card = await (
             A2ACardResolver(
                 httpx_client=httpx_client,
@@ -147,6 +175,45 @@ def create_send_params(
     return MessageSendParams(**send_params)
 
 
+def _format_parts(prefix: str, parts) -> str:
+    for part in parts:
+        if isinstance(part.root, TextPart):
+            return f'{prefix}type: {part.root.type}, text: {part.root.text}'
+    return ''
+
+
+def _format_message(result: Message) -> str:
+    return _format_parts(
+        f'stream message => role: {result.role.value}, ', result.parts
+    )
+
+
+def _format_task(result: Task) -> str:
+    for msg in result.history or []:
+        line = _format_message(msg)
+        if line:
+            return line
+    return ''
+
+
+def _format_status_update(result: TaskStatusUpdateEvent) -> str:
+    if not result.status.message:
+        return ''
+    return _format_message(result.status.message)
+
+
+def _format_artifact_update(result: TaskArtifactUpdateEvent) -> str:
+    return _format_parts('stream artifact => ', result.artifact.parts)
+
+
+_STREAM_FORMATTERS = {
+    Message: _format_message,
+    Task: _format_task,
+    TaskStatusUpdateEvent: _format_status_update,
+    TaskArtifactUpdateEvent: _format_artifact_update,
+}
+
+
 async def complete_task(
     client: A2AClient,
     streaming: bool,
@@ -173,55 +240,14 @@ async def complete_task(
             SendStreamingMessageRequest(id=str(uuid4()), params=send_params)
         )
         async for chunk in stream_response:
-            result = chunk.root.result
-            print(
-                f'stream event => {chunk.root.model_dump_json(exclude_none=True)}'
-                if debug
-                else (
-                    next(
-                        (
-                            f'stream message => role: {result.role.value}, type: {part.root.type}, text: {part.root.text}'
-                            for part in result.parts
-                            if isinstance(part.root, TextPart)
-                        ),
-                        '',
-                    )
-                    if isinstance(result, Message)
-                    else next(
-                        (
-                            f'stream message => role: {msg.role.value}, type: {part.root.type}, text: {part.root.text}'
-                            for msg in result.history or []
-                            for part in msg.parts
-                            if isinstance(part.root, TextPart)
-                        ),
-                        '',
-                    )
-                    if isinstance(result, Task)
-                    else next(
-                        (
-                            f'stream message => role: {result.status.message.role.value}, type: {part.root.type}, text: {part.root.text}'
-                            for part in (
-                                result.status.message.parts
-                                if result.status.message
-                                else []
-                            )
-                            if isinstance(part.root, TextPart)
-                        ),
-                        '',
-                    )
-                    if isinstance(result, TaskStatusUpdateEvent)
-                    else next(
-                        (
-                            f'stream artifact => type: {part.root.type}, text: {part.root.text}'
-                            for part in result.artifact.parts
-                            if isinstance(part.root, TextPart)
-                        ),
-                        '',
-                    )
-                    if isinstance(result, TaskArtifactUpdateEvent)
-                    else ''
+            if debug:
+                print(
+                    f'stream event => {chunk.root.model_dump_json(exclude_none=True)}'
                 )
-            )
+                continue
+            result = chunk.root.result
+            formatter = _STREAM_FORMATTERS.get(type(result))
+            print(formatter(result) if formatter else '')
 
         get_task_response = await client.get_task(
             GetTaskRequest(id=str(uuid4()), params=TaskQueryParams(id=task_id))
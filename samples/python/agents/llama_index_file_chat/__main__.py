@@ -1,8 +1,10 @@
+import contextlib
 import logging
 import os
 
 import click
 import httpx
+import uvicorn
 
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
@@ -65,7 +67,13 @@ def main(host, port):
             skills=[skill],
         )
 
-        httpx_client = httpx.AsyncClient()
+        httpx_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=200
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
         request_handler = DefaultRequestHandler(
             agent_executor=LlamaIndexAgentExecutor(
                 agent=ParseAndChat(),
@@ -76,9 +84,21 @@ def main(host, port):
         server = A2AStarletteApplication(
             agent_card=agent_card, http_handler=request_handler
         )
-        import uvicorn
 
-        uvicorn.run(server.build(), host=host, port=port)
+        @contextlib.asynccontextmanager
+        async def lifespan(app):
+            # the push notification client is shared by every task; release
+            # its pooled connections when the server shuts down
+            yield
+            await httpx_client.aclose()
+
+        uvicorn.run(
+            server.build(lifespan=lifespan),
+            host=host,
+            port=port,
+            loop='uvloop',
+            http='httptools',
+        )
     except MissingAPIKeyError as e:
         logger.error(f'Error: {e}')
         exit(1)
@@ -1,6 +1,9 @@
+import asyncio
 import base64
+import hashlib
 import os
 
+from collections import OrderedDict
 from typing import Any
 
 from llama_cloud_services.parse import LlamaParse
@@ -17,6 +20,17 @@ from llama_index.llms.google_genai import GoogleGenAI
 from pydantic import BaseModel, Field
 
 
+# Number of parsed documents kept in memory, so follow-up turns that re-send
+# the same file skip the (slow) parse.
+MAX_PARSED_FILES = 32
+
+
+def _attachment_key(attachment: bytes | str) -> str:
+    if isinstance(attachment, str):
+        attachment = attachment.encode()
+    return hashlib.blake2b(attachment, digest_size=16).hexdigest()
+
+
 ## Workflow Events
 
 
@@ -26,12 +40,13 @@ class LogEvent(Event):
 
 class InputEvent(StartEvent):
     msg: str
-    attachment: str | None = None
+    # raw file bytes, or base64-encoded text as sent in an A2A FilePart
+    attachment: bytes | str | None = None
     file_name: str | None = None
 
 
 class ParseEvent(Event):
-    attachment: str
+    attachment: bytes | str
     file_name: str
     msg: str
 
@@ -40,9 +55,15 @@ class ChatEvent(Event):
     msg: str
 
 
+class ResponseDeltaEvent(Event):
+    delta: str
+
+
 class ChatResponseEvent(StopEvent):
     response: str
-    citations: dict[int, list[str]]
+    # keyed by the in-line citation number as a string, ready to be used as
+    # A2A artifact metadata
+    citations: dict[str, list[str]]
 
 
 ## Structured Outputs
@@ -66,7 +87,7 @@ class ChatResponse(BaseModel):
         description='The response to the user including in-line citations (if any).'
     )
     citations: list[Citation] = Field(
-        default=list,
+        default_factory=list,
         description='A list of citations, where each citation is an object to map the citation number to the line numbers in the document that are being cited.',
     )
 
@@ -83,6 +104,11 @@ class ParseAndChat(Workflow):
             model='gemini-2.0-flash', api_key=os.getenv('GOOGLE_API_KEY')
         ).as_structured_llm(ChatResponse)
         self._parser = LlamaParse(api_key=os.getenv('LLAMA_CLOUD_API_KEY'))
+        # attachment hash -> (system prompt, document lines), least recently
+        # used first
+        self._parsed_files: OrderedDict[str, tuple[str, list[str]]] = (
+            OrderedDict()
+        )
         self._system_prompt_template = """\
 You are a helpful assistant that can answer questions about a document, provide citations, and engage in a conversation.
 
@@ -99,6 +125,11 @@ When citing content from the document:
 5. For example, if the response contains "The transformer architecture... [1]." and "Attention mechanisms... [2].", and these come from lines 10-12 and 45-46 respectively, then: citations = [[10, 11, 12], [45, 46]]
 6. Always start your citations at [1] and increase by 1 for each additional in-line citation. DO NOT use the line numbers as the in-line citation numbers or I will lose my job.
 """
+        # the template has a single placeholder, so split it once and
+        # concatenate instead of re-parsing it with str.format
+        self._prompt_prefix, self._prompt_suffix = (
+            self._system_prompt_template.split('{document_text}')
+        )
 
     @step
     def route(self, ev: InputEvent) -> ParseEvent | ChatEvent:
@@ -110,9 +141,40 @@ When citing content from the document:
 
     @step
     async def parse(self, ctx: Context, ev: ParseEvent) -> ChatEvent:
+        key = await asyncio.to_thread(_attachment_key, ev.attachment)
+        cached = self._parsed_files.get(key)
+        if cached is not None:
+            ctx.write_event_to_stream(
+                LogEvent(msg='Document already parsed, reusing it.')
+            )
+            self._parsed_files.move_to_end(key)
+            system_prompt, document_lines = cached
+        else:
+            system_prompt, document_lines = await self._parse_document(ctx, ev)
+            self._parsed_files[key] = (system_prompt, document_lines)
+            if len(self._parsed_files) > MAX_PARSED_FILES:
+                self._parsed_files.popitem(last=False)
+
+        # the system prompt only depends on the document, so format it once
+        # here instead of on every chat turn
+        await ctx.set('system_prompt', system_prompt)
+        # keep the raw lines so citations can be resolved by index
+        await ctx.set('document_lines', document_lines)
+        return ChatEvent(msg=ev.msg)
+
+    async def _parse_document(
+        self, ctx: Context, ev: ParseEvent
+    ) -> tuple[str, list[str]]:
         ctx.write_event_to_stream(LogEvent(msg='Parsing document...'))
+        if isinstance(ev.attachment, bytes | bytearray):
+            file_bytes = ev.attachment
+        else:
+            # decoding a large upload is CPU-bound, keep it off the event loop
+            file_bytes = await asyncio.to_thread(
+                base64.b64decode, ev.attachment
+            )
         results = await self._parser.aparse(
-            base64.b64decode(ev.attachment),
+            file_bytes,
             extra_info={'file_name': ev.file_name},
         )
         ctx.write_event_to_stream(LogEvent(msg='Document parsed successfully.'))
@@ -124,12 +186,18 @@ When citing content from the document:
 
         # split the document into lines and add line numbers
         # this will be used for citations
-        document_text = ''
-        for idx, line in enumerate(document.text.split('\n')):
-            document_text += f"<line idx='{idx}'>{line}</line>\n"
+        document_lines = document.text.splitlines()
+        # the lines are all we need from here on; release the parser output
+        del document, documents, results
+        document_text = ''.join(
+            f"<line idx='{idx}'>{line}</line>\n"
+            for idx, line in enumerate(document_lines)
+        )
 
-        await ctx.set('document_text', document_text)
-        return ChatEvent(msg=ev.msg)
+        system_prompt = (
+            self._prompt_prefix + document_text + self._prompt_suffix
+        )
+        return system_prompt, document_lines
 
     @step
     async def chat(self, ctx: Context, event: ChatEvent) -> ChatResponseEvent:
@@ -141,25 +209,39 @@ When citing content from the document:
             )
         )
 
-        document_text = await ctx.get('document_text', default='')
-        if document_text:
+        system_prompt = await ctx.get('system_prompt', default='')
+        if system_prompt:
             ctx.write_event_to_stream(
                 LogEvent(msg='Inserting system prompt...')
             )
             input_messages = [
-                ChatMessage(
-                    role='system',
-                    content=self._system_prompt_template.format(
-                        document_text=document_text
-                    ),
-                ),
+                ChatMessage(role='system', content=system_prompt),
                 *current_messages,
             ]
         else:
             input_messages = current_messages
 
-        response = await self._sllm.achat(input_messages)
-        response_obj: ChatResponse = response.raw
+        # stream the structured output so the answer text can be surfaced as
+        # it is generated; each chunk carries the partial object so far
+        streamed_text = ''
+        raw = None
+        async for chunk in await self._sllm.astream_chat(input_messages):
+            if chunk.raw is None:
+                continue
+            raw = chunk.raw
+            text = getattr(raw, 'response', None) or ''
+            if len(text) > len(streamed_text):
+                ctx.write_event_to_stream(
+                    ResponseDeltaEvent(delta=text[len(streamed_text) :])
+                )
+                streamed_text = text
+        if raw is None:
+            # the stream produced no structured output; fall back to a
+            # regular call rather than validating nothing
+            raw = (await self._sllm.achat(input_messages)).raw
+        response_obj = ChatResponse.model_validate(
+            raw.model_dump() if isinstance(raw, BaseModel) else raw
+        )
         ctx.write_event_to_stream(
             LogEvent(msg='LLM response received, parsing citations...')
         )
@@ -171,28 +253,16 @@ When citing content from the document:
 
         # parse out the citations from the document text
         citations = {}
-        if document_text:
+        if system_prompt:
+            document_lines = await ctx.get('document_lines', default=[])
             for citation in response_obj.citations:
                 line_numbers = citation.line_numbers
                 for line_number in line_numbers:
-                    start_idx = document_text.find(
-                        f"<line idx='{line_number}'>"
-                    )
-                    end_idx = document_text.find(
-                        f"<line idx='{line_number + 1}'>"
-                    )
-                    citation_text = (
-                        document_text[
-                            start_idx
-                            + len(f"<line idx='{line_number}'>") : end_idx
-                        ]
-                        .replace('</line>', '')
-                        .strip()
-                    )
-
-                    if citation.citation_number not in citations:
-                        citations[citation.citation_number] = []
-                    citations[citation.citation_number].append(citation_text)
+                    if not 0 <= line_number < len(document_lines):
+                        continue
+                    citations.setdefault(
+                        str(citation.citation_number), []
+                    ).append(document_lines[line_number].strip())
 
         return ChatResponseEvent(
             response=response_obj.response, citations=citations
@@ -238,6 +308,4 @@ async def main():
 
 
 if __name__ == '__main__':
-    import asyncio
-
     asyncio.run(main())
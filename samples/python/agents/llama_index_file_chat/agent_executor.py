@@ -1,5 +1,8 @@
+import asyncio
 import logging
-import traceback
+import time
+
+from collections import OrderedDict
 
 from a2a.server.agent_execution import AgentExecutor, RequestContext
 from a2a.server.events import EventQueue
@@ -14,18 +17,28 @@ from a2a.types import (
     TextPart,
     UnsupportedOperationError,
 )
-from a2a.utils import are_modalities_compatible, new_agent_text_message
+from a2a.utils import new_agent_text_message
 from a2a.utils.errors import ServerError
 from agents.llama_index_file_chat.agent import (
     ChatResponseEvent,
     InputEvent,
     LogEvent,
     ParseAndChat,
+    ResponseDeltaEvent,
 )
+from llama_index.core.workflow import Context
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of sessions whose workflow context is kept in memory; the
+# least recently used session is dropped beyond this.
+MAX_SESSIONS = 1000
+
+# Answer deltas arriving within this many seconds of the last update are
+# coalesced into a single status update instead of one event per delta.
+DELTA_FLUSH_INTERVAL = 0.05
+
 
 class LlamaIndexAgentExecutor(AgentExecutor):
     """LlamaIndex AgentExecutor implementation."""
@@ -39,15 +52,22 @@ class LlamaIndexAgentExecutor(AgentExecutor):
         'image/jpeg',
     ]
     SUPPORTED_OUTPUT_TYPES = ['text', 'text/plain']
+    # for O(1) membership checks when validating each request
+    SUPPORTED_OUTPUT_SET = frozenset(SUPPORTED_OUTPUT_TYPES)
 
     def __init__(
         self,
         agent: ParseAndChat,
     ):
         self.agent = agent
-        # Store context state by session ID
+        # Store the live workflow context by session ID. It never leaves this
+        # process, so keep the object itself rather than a to_dict() snapshot.
         # Ideally, you would use a database or other kv store the context state
-        self.ctx_states: Dict[str, Dict[str, Any]] = {}
+        self.ctx_states: OrderedDict[str, Context] = OrderedDict()
+        # Per-session lock serializing concurrent turns, kept only while some
+        # request holds or waits on it (counted in _session_lock_users)
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._session_lock_users: dict[str, int] = {}
 
     async def execute(
         self,
@@ -61,18 +81,41 @@ class LlamaIndexAgentExecutor(AgentExecutor):
         input_event = self._get_input_event(context)
         context_id = context.context_id
         task_id = context.task_id
+        # Serialize turns of the same session so a retried request waits for
+        # the first one (and its parse) instead of racing it on the context.
+        lock = self._session_locks.setdefault(context_id, asyncio.Lock())
+        users = self._session_lock_users
+        users[context_id] = users.get(context_id, 0) + 1
+        try:
+            async with lock:
+                await self._run_session(
+                    input_event, context_id, task_id, event_queue
+                )
+        finally:
+            users[context_id] -= 1
+            if not users[context_id]:
+                # nobody holds or waits on the lock any more
+                del users[context_id]
+                del self._session_locks[context_id]
+
+    async def _run_session(
+        self,
+        input_event: InputEvent,
+        context_id: str,
+        task_id: str,
+        event_queue: EventQueue,
+    ) -> None:
         try:
             ctx = None
             handler = None
 
             # Check if we have a saved context state for this session
-            print(f'Len of ctx_states: {len(self.ctx_states)}', flush=True)
-            saved_ctx_state = self.ctx_states.get(context_id, None)
+            logger.debug('Len of ctx_states: %d', len(self.ctx_states))
+            ctx = self.ctx_states.get(context_id, None)
 
-            if saved_ctx_state is not None:
+            if ctx is not None:
                 # Resume with existing context
                 logger.info(f'Resuming session {context_id} with saved context')
-                ctx = Context.from_dict(self.agent, saved_ctx_state)
                 handler = self.agent.run(
                     start_event=input_event,
                     ctx=ctx,
@@ -87,29 +130,50 @@ class LlamaIndexAgentExecutor(AgentExecutor):
             # Emit an initial task object
             updater = TaskUpdater(event_queue, task_id, context_id)
             await updater.submit()
+            pending_deltas: list[str] = []
+            last_flush = time.monotonic()
+
+            async def flush_deltas() -> None:
+                nonlocal last_flush
+                if pending_deltas:
+                    await updater.update_status(
+                        TaskState.working,
+                        new_agent_text_message(
+                            ''.join(pending_deltas), context_id, task_id
+                        ),
+                    )
+                    pending_deltas.clear()
+                last_flush = time.monotonic()
+
             async for event in handler.stream_events():
                 if isinstance(event, LogEvent):
+                    # Keep ordering: any buffered answer text goes out first
+                    await flush_deltas()
                     # Send log event as intermediate message
                     await updater.update_status(
                         TaskState.working,
                         new_agent_text_message(event.msg, context_id, task_id),
                     )
+                elif isinstance(event, ResponseDeltaEvent):
+                    # Send the answer text as it is generated, in batches
+                    pending_deltas.append(event.delta)
+                    if time.monotonic() - last_flush >= DELTA_FLUSH_INTERVAL:
+                        await flush_deltas()
+            await flush_deltas()
 
             # Wait for final response
             final_response = await handler
             if isinstance(final_response, ChatResponseEvent):
                 content = final_response.response
-                metadata = (
-                    final_response.citations
-                    if hasattr(final_response, 'citations')
-                    else None
-                )
-                if metadata is not None:
-                    # ensure metadata is a dict of str keys
-                    metadata = {str(k): v for k, v in metadata.items()}
+                # citations is a declared field, already keyed by str as
+                # metadata requires
+                metadata = final_response.citations or None
 
-                # save the context state to resume the current session
-                self.ctx_states[context_id] = handler.ctx.to_dict()
+                # save the context to resume the current session
+                self.ctx_states[context_id] = handler.ctx
+                self.ctx_states.move_to_end(context_id)
+                while len(self.ctx_states) > MAX_SESSIONS:
+                    self.ctx_states.popitem(last=False)
 
                 await updater.add_artifact(
                     [Part(root=TextPart(text=content))],
@@ -121,8 +185,7 @@ class LlamaIndexAgentExecutor(AgentExecutor):
                 await updater.failed(f'Unexpected completion {final_response}')
 
         except Exception as e:
-            logger.error(f'An error occurred while streaming the response: {e}')
-            logger.error(traceback.format_exc())
+            logger.exception('An error occurred while streaming the response')
 
             # Clean up context in case of error
             if context_id in self.ctx_states:
@@ -141,7 +204,7 @@ class LlamaIndexAgentExecutor(AgentExecutor):
     def _validate_request(self, context: RequestContext) -> bool:
         """True means invalid, false is valid."""
         invalidOutput = self._validate_output_modes(
-            context, self.SUPPORTED_OUTPUT_TYPES
+            context, self.SUPPORTED_OUTPUT_SET
         )
         return invalidOutput or self._validate_push_config(context)
 
@@ -152,15 +215,18 @@ class LlamaIndexAgentExecutor(AgentExecutor):
         text_parts = []
         for p in context.message.parts:
             part = p.root
-            if isinstance(part, FilePart):
-                file_data = part.file.bytes
+            # Part.root is always one of the concrete a2a part models, so an
+            # exact type check is enough; text parts are the common case.
+            part_type = type(part)
+            if part_type is TextPart:
+                text_parts.append(part.text)
+            elif part_type is FilePart:
+                file_data = getattr(part.file, 'bytes', None)
                 file_name = part.file.name
                 if file_data is None:
                     raise ValueError('File data is missing!')
-            elif isinstance(part, TextPart):
-                text_parts.append(part.text)
             else:
-                raise ValueError(f'Unsupported part type: {type(part)}')
+                raise ValueError(f'Unsupported part type: {part_type}')
 
         return InputEvent(
             msg='\n'.join(text_parts),
@@ -171,16 +237,17 @@ class LlamaIndexAgentExecutor(AgentExecutor):
     def _validate_output_modes(
         self,
         context: RequestContext,
-        supportedTypes: list[str],
+        supportedTypes: frozenset[str],
     ) -> bool:
         accepted_output_modes = (
             context.configuration.accepted_output_modes
             if context.configuration
             else []
         )
-        if not are_modalities_compatible(
-            accepted_output_modes,
-            supportedTypes,
+        # same rule as are_modalities_compatible: no accepted modes means
+        # anything goes, otherwise at least one must be supported
+        if accepted_output_modes and supportedTypes.isdisjoint(
+            accepted_output_modes
         ):
             logger.warning(
                 'Unsupported output mode. Received %s, Support %s',
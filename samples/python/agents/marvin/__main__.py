@@ -34,6 +34,10 @@ class ContactInfo(BaseModel):
     role: str | None = Field(None, description="Job title or role if mentioned")
 
 
+# Result types selectable with --result-type.
+RESULT_TYPES: dict[str, type[BaseModel]] = {"ContactInfo": ContactInfo}
+
+
 @click.command()
 @click.option("--host", "host", default="localhost")
 @click.option("--port", "port", default=10030)
@@ -46,9 +50,11 @@ class ContactInfo(BaseModel):
 def main(host, port, result_type, instructions):
     """Starts the Marvin Contact Extractor Agent server."""
     try:
-        result_type = eval(result_type)
-    except Exception as e:
-        logger.error(f"Invalid result type: {e}")
+        result_type = RESULT_TYPES[result_type]
+    except KeyError:
+        logger.error(
+            f"Invalid result type: {result_type!r}, expected one of {list(RESULT_TYPES)}"
+        )
         exit(1)
     agent = ExtractorAgent(instructions=instructions, result_type=result_type)
     request_handler = DefaultRequestHandler(
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import threading
@@ -5,9 +6,11 @@ from collections.abc import AsyncIterable
 from typing import Annotated, Any, ClassVar
 
 from a2a.types import TextPart
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 import marvin
+from marvin.engine.events import AgentMessageEvent, Event
+from marvin.engine.handlers import AsyncHandler
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,17 @@ def _to_text_part(text: str) -> TextPart:
     return TextPart(text=text)
 
 
+class _AgentMessageForwarder(AsyncHandler):
+    """Forwards the text of each agent message to a queue as it is emitted."""
+
+    def __init__(self, queue: asyncio.Queue[str | None]):
+        self.queue = queue
+
+    async def on_event(self, event: Event):
+        if isinstance(event, AgentMessageEvent) and event.message.content:
+            self.queue.put_nowait(event.message.content)
+
+
 class ExtractionOutcome[T](BaseModel):
     """Represents the result of trying to extract contact info."""
 
@@ -42,13 +56,29 @@ class ExtractorAgent[T]:
     def __init__(self, instructions: str, result_type: type[T]):
         self.instructions = instructions
         self.result_type = result_type
+        # Built once: parameterizing the generic model and the union is not
+        # free, and neither changes between requests.
+        self._result_union = ExtractionOutcome[result_type] | ClarifyingQuestion
+        # Build the union's schema and validator once at startup so the first
+        # request doesn't pay for it.
+        self._result_adapter = TypeAdapter(self._result_union)
+        self._context = {
+            "your personality": instructions,
+            "reminder": "Use your memory to help fill out the form",
+        }
 
-    async def invoke(self, query: str, sessionId: str) -> dict[str, Any]:
+    async def invoke(
+        self,
+        query: str,
+        sessionId: str,
+        handlers: list[AsyncHandler] | None = None,
+    ) -> dict[str, Any]:
         """Process a user query with marvin
 
         Args:
             query: The user's input text.
             sessionId: The session identifier
+            handlers: Optional marvin event handlers for the run.
 
         Returns:
             A dictionary describing the outcome and necessary next steps.
@@ -60,12 +90,10 @@ class ExtractorAgent[T]:
 
             result = await marvin.run_async(
                 query,
-                context={
-                    "your personality": self.instructions,
-                    "reminder": "Use your memory to help fill out the form",
-                },
+                context=self._context,
                 thread=marvin.Thread(id=sessionId),
-                result_type=ExtractionOutcome[self.result_type] | ClarifyingQuestion,
+                result_type=self._result_union,
+                handlers=handlers,
             )
 
             if isinstance(result, ExtractionOutcome):
@@ -113,4 +141,21 @@ class ExtractorAgent[T]:
             "content": "Analyzing your text for contact information...",
         }
 
-        yield await self.invoke(query, sessionId)
+        # Marvin emits whole agent messages rather than tokens, so relay each
+        # one as soon as it is produced instead of waiting for the full run.
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+        run = asyncio.create_task(
+            self.invoke(query, sessionId, handlers=[_AgentMessageForwarder(queue)])
+        )
+        run.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (text := await queue.get()) is not None:
+                yield {
+                    "is_task_complete": False,
+                    "require_user_input": False,
+                    "content": text,
+                    "partial": True,
+                }
+            yield run.result()
+        finally:
+            run.cancel()
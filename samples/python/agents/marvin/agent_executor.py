@@ -38,31 +38,43 @@ class ExtractorAgentExecutor(AgentExecutor):
             task = new_task(context.message)
             await event_queue.enqueue_event(task)
 
+        last_working_content = None
         async for item in self.agent.stream(query, task.context_id):
             is_task_complete = item["is_task_complete"]
             require_user_input = item["require_user_input"]
-            content = item["content"]
 
             logger.info(
-                f"Stream item received: complete={is_task_complete}, require_input={require_user_input}, content_len={len(content)}"
+                "Stream item received: complete=%s, require_input=%s",
+                is_task_complete,
+                require_user_input,
             )
 
-            agent_outcome = await self.agent.invoke(query, task.context_id)
-            is_task_complete = agent_outcome["is_task_complete"]
-            require_user_input = not is_task_complete
-            content = agent_outcome.get("text_parts", [])
-            data = agent_outcome.get("data", {})
-            artifact = new_text_artifact(
-                name="current_result",
-                description="Result of request to agent.",
-                text=content,
-            )
-            if data:
-                artifact = new_data_artifact(
-                    name="current_result",
-                    description="Result of request to agent.",
-                    data=data,
+            if not is_task_complete and not require_user_input:
+                # Intermediate progress update; the agent outcome follows as
+                # the final stream item, so there is nothing to invoke here.
+                # Identical consecutive updates are not worth re-sending.
+                if item["content"] == last_working_content:
+                    continue
+                last_working_content = item["content"]
+                await event_queue.enqueue_event(
+                    TaskStatusUpdateEvent(
+                        status=TaskStatus(
+                            state=TaskState.working,
+                            message=new_agent_text_message(
+                                item["content"],
+                                task.context_id,
+                                task.id,
+                            ),
+                        ),
+                        final=False,
+                        context_id=task.context_id,
+                        task_id=task.id,
+                    )
                 )
+                continue
+
+            content = "\n".join(part.text for part in item.get("text_parts", []))
+            data = item.get("data")
 
             if require_user_input:
                 await event_queue.enqueue_event(
@@ -80,7 +92,19 @@ class ExtractorAgentExecutor(AgentExecutor):
                         task_id=task.id,
                     )
                 )
-            elif is_task_complete:
+            else:
+                if data:
+                    artifact = new_data_artifact(
+                        name="current_result",
+                        description="Result of request to agent.",
+                        data=data,
+                    )
+                else:
+                    artifact = new_text_artifact(
+                        name="current_result",
+                        description="Result of request to agent.",
+                        text=content,
+                    )
                 await event_queue.enqueue_event(
                     TaskArtifactUpdateEvent(
                         append=False,
@@ -98,22 +122,6 @@ class ExtractorAgentExecutor(AgentExecutor):
                         task_id=task.id,
                     )
                 )
-            else:
-                await event_queue.enqueue_event(
-                    TaskStatusUpdateEvent(
-                        status=TaskStatus(
-                            state=TaskState.working,
-                            message=new_agent_text_message(
-                                "Analyzing your text...",
-                                task.context_id,
-                                task.id,
-                            ),
-                        ),
-                        final=False,
-                        context_id=task.context_id,
-                        task_id=task.id,
-                    )
-                )
 
     async def cancel(self, context: RequestContext, event_queue: EventQueue) -> None:
         raise Exception("cancel not supported")
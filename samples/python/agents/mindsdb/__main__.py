@@ -1,3 +1,4 @@
+import contextlib
 import os
 import sys
 
@@ -23,17 +24,25 @@ def main(host, port):
         print('MINDS_API_KEY environment variable not set.')
         sys.exit(1)
 
+    agent_executor = MindsDBAgentExecutor()
     request_handler = DefaultRequestHandler(
-        agent_executor=MindsDBAgentExecutor(),
+        agent_executor=agent_executor,
         task_store=InMemoryTaskStore(),
     )
 
     server = A2AStarletteApplication(
         agent_card=get_agent_card(host, port), http_handler=request_handler
     )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app):
+        yield
+        # Release the agent's pooled MindsDB connections on shutdown
+        await agent_executor.agent.aclose()
+
     import uvicorn
 
-    uvicorn.run(server.build(), host=host, port=port)
+    uvicorn.run(server.build(lifespan=lifespan), host=host, port=port)
 
 
 def get_agent_card(host: str, port: int):
@@ -1,10 +1,10 @@
-import json
 import os
 
 from collections.abc import AsyncIterable
 from typing import Any
 
 import aiohttp
+import orjson
 
 from dotenv import load_dotenv
 
@@ -14,6 +14,9 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Bytes read from the response per await while streaming.
+STREAM_CHUNK_SIZE = 16384
+
 
 class MindsDBAgent:
     """An agent that data requests from any database, datawarehouse, app."""
@@ -34,6 +37,26 @@ class MindsDBAgent:
             'Content-Type': 'application/json',
             'Authorization': f'Bearer {self.api_key}',
         }
+        # Created on first use, since it must be bound to the running loop
+        self._session: aiohttp.ClientSession | None = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, so requests reuse pooled connections."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=32,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                )
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def invoke(self, query, session_id) -> str:
         return {'content': 'Use stream method to get the results!'}
@@ -47,58 +70,76 @@ class MindsDBAgent:
             ],
             'stream': True,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.API_URL, headers=self.headers, json=payload
-            ) as response:
-                async for line in response.content:
-                    if line:
-                        # Skip empty lines
-                        line = line.decode('utf-8').strip()
-                        if not line or not line.startswith('data: '):
-                            continue
-
-                        # Parse the JSON data
-                        json_str = line[6:]  # Remove "data: " prefix
-                        try:
-                            data = json.loads(json_str)
-                        except json.JSONDecodeError:
-                            continue
-                        if 'choices' in data:
-                            choice = data['choices'][0]
-                            delta = choice.get('delta', {})
-                            content = delta.get('content')
-                            role = delta.get('role', '')
-                            parts = [{'type': 'text', 'text': content}]
-                            if choice.get('finish_reason') == 'stop':
-                                yield {'is_task_complete': True, 'parts': parts}
-                                continue
-
-                            subtype = 'analysis'
-                            tool_calls = delta.get('tool_calls', [])
-
-                            if role == 'assistant':
-                                subtype = 'acknowledge'
-
-                            if tool_calls:
-                                tool_call = tool_calls[0]
-                                function = tool_call.get('function', {})
-                                function_name = str(function.get('name'))
-                                arguments = function.get('arguments', {})
-
-                                if function_name == 'sql_db_query':
-                                    subtype = 'execute_query'
-
-                                    parts.append(
-                                        {'type': 'text', 'text': str(arguments)}
-                                    )
-
-                            yield {
-                                'is_task_complete': False,
-                                'parts': parts,
-                                'metadata': {
-                                    'type': 'reasoning',
-                                    'subtype': subtype,
-                                },
-                            }
-                            continue
+        session = await self._get_session()
+        async with session.post(
+            self.API_URL, headers=self.headers, json=payload
+        ) as response:
+            # Read the body in large chunks and split out whole lines
+            # instead of awaiting and decoding the stream line by line.
+            # One buffer is reused for the whole stream: lines are sliced
+            # out by offset and consumed bytes are dropped once per chunk.
+            # SSE allows CRLF, CR or LF line endings; mapping every CR to LF
+            # only adds empty lines, which are skipped like blank separators.
+            buffer = bytearray()
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                buffer.extend(chunk.replace(b'\r', b'\n'))
+                start = 0
+                while (end := buffer.find(b'\n', start)) != -1:
+                    item = self._parse_line(buffer[start:end])
+                    start = end + 1
+                    if item is not None:
+                        yield item
+                del buffer[:start]
+            # The last line may not be followed by a line ending
+            item = self._parse_line(buffer)
+            if item is not None:
+                yield item
+
+    def _parse_line(self, line: bytes | bytearray) -> dict[str, Any] | None:
+        """Turn one SSE ``data:`` line into a stream item, or None to skip it."""
+        line = line.strip()
+        if not line.startswith(b'data: '):
+            return None
+        json_str = line[6:]  # Remove "data: " prefix
+
+        # Parse the JSON data; orjson reads the bytes as-is
+        try:
+            data = orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            return None
+        if 'choices' not in data:
+            return None
+
+        choice = data['choices'][0]
+        delta = choice.get('delta', {})
+        content = delta.get('content')
+        role = delta.get('role', '')
+        parts = [{'type': 'text', 'text': content}]
+        if choice.get('finish_reason') == 'stop':
+            return {'is_task_complete': True, 'parts': parts}
+
+        subtype = 'analysis'
+        tool_calls = delta.get('tool_calls', [])
+
+        if role == 'assistant':
+            subtype = 'acknowledge'
+
+        if tool_calls:
+            tool_call = tool_calls[0]
+            function = tool_call.get('function', {})
+            function_name = str(function.get('name'))
+            arguments = function.get('arguments', {})
+
+            if function_name == 'sql_db_query':
+                subtype = 'execute_query'
+
+                parts.append({'type': 'text', 'text': str(arguments)})
+
+        return {
+            'is_task_complete': False,
+            'parts': parts,
+            'metadata': {
+                'type': 'reasoning',
+                'subtype': subtype,
+            },
+        }
@@ -32,9 +32,15 @@ class MindsDBAgentExecutor(AgentExecutor):
         updater = TaskUpdater(event_queue, task.id, task.context_id)
 
         try:
+            last_metadata = None
             async for item in self.agent.stream(query, task.context_id):
                 is_task_complete = item['is_task_complete']
                 if not is_task_complete:
+                    # The status message only carries the reasoning metadata,
+                    # so consecutive deltas of the same subtype would repeat it
+                    if item['metadata'] == last_metadata:
+                        continue
+                    last_metadata = item['metadata']
                     await updater.update_status(
                         TaskState.working,
                         new_agent_text_message(
@@ -0,0 +1,101 @@
+"""Tests for the SSE reader in MindsDBAgent.stream.
+
+The HTTP response is faked, so no MindsDB server or API key is needed::
+
+    cd samples/python/agents/mindsdb
+    python -m pytest test_agent.py
+"""
+
+# ruff: noqa: S101  # `assert` is the standard pytest pattern.
+
+import asyncio
+
+import orjson
+import pytest
+
+from agent import MindsDBAgent
+
+
+def _data_line(content: str, finish_reason: str | None = None) -> bytes:
+    choice = {'delta': {'content': content}, 'finish_reason': finish_reason}
+    return b'data: ' + orjson.dumps({'choices': [choice]})
+
+
+class _FakeContent:
+    def __init__(self, body: bytes, chunk_size: int):
+        self._body = body
+        self._chunk_size = chunk_size
+
+    async def iter_chunked(self, _n: int):
+        for i in range(0, len(self._body), self._chunk_size):
+            yield self._body[i : i + self._chunk_size]
+
+
+class _FakeResponse:
+    def __init__(self, body: bytes, chunk_size: int):
+        self.content = _FakeContent(body, chunk_size)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, body: bytes, chunk_size: int):
+        self._response = _FakeResponse(body, chunk_size)
+
+    def post(self, *args, **kwargs):
+        return self._response
+
+
+def _stream(monkeypatch, body: bytes, chunk_size: int) -> list[dict]:
+    monkeypatch.setenv('MINDS_API_KEY', 'test-key')
+    agent = MindsDBAgent()
+
+    async def fake_get_session():
+        return _FakeSession(body, chunk_size)
+
+    monkeypatch.setattr(agent, '_get_session', fake_get_session)
+
+    async def collect():
+        return [item async for item in agent.stream('query', 'session')]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize('newline', [b'\n', b'\r\n', b'\r'])
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_final_event_without_trailing_blank_line(
+    monkeypatch, newline, chunk_size
+):
+    body = (
+        _data_line('Hello') + newline * 2 + _data_line('', finish_reason='stop')
+    )
+
+    items = _stream(monkeypatch, body, chunk_size)
+
+    assert [item['is_task_complete'] for item in items] == [False, True]
+    assert items[0]['parts'] == [{'type': 'text', 'text': 'Hello'}]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+def test_consecutive_data_lines_are_separate_events(monkeypatch, chunk_size):
+    body = b'\n'.join(
+        [
+            _data_line('Hello'),
+            _data_line(' world'),
+            _data_line('', finish_reason='stop'),
+            b'',
+        ]
+    )
+
+    items = _stream(monkeypatch, body, chunk_size)
+
+    assert [item['parts'][0]['text'] for item in items] == [
+        'Hello',
+        ' world',
+        '',
+    ]
+    assert items[-1]['is_task_complete'] is True
@@ -66,6 +66,11 @@ alice_card = AgentCard.model_validate(alice_card_dict)
 
 # ------------------ Internal helpers ------------------
 
+# Nearly every reply is one of the two fixed hints, so build their parts once.
+_HINT_PARTS = {
+    hint: Part(root=TextPart(text=hint)) for hint in ('Go higher', 'Go lower')
+}
+
 
 class NumberGuessExecutor(AgentExecutor):
     """AgentExecutor implementing the number‐guessing logic directly."""
@@ -86,7 +91,10 @@ class NumberGuessExecutor(AgentExecutor):
         # finally mark it completed so Bob sees a full Task object with the
         # artifact attached.
         await updater.submit()
-        await updater.add_artifact([Part(root=TextPart(text=response_text))])
+        part = _HINT_PARTS.get(response_text) or Part(
+            root=TextPart(text=response_text)
+        )
+        await updater.add_artifact([part])
         await updater.complete()
 
     async def cancel(
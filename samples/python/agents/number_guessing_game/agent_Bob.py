@@ -4,7 +4,7 @@ AgentBob – command-line front-end for the toy A2A number-guessing game.
 Bob mediates between a human player and two peer agents:
 
 * **AgentAlice** – holds the secret number and grades guesses.
-* **AgentCarol** – produces textual visualisations (and optional shuffles)
+* **AgentCarol** – produces textual visualisations (and sorted copies)
   of Bob's accumulated guess history.
 """
 
@@ -63,11 +63,12 @@ def _extract_history_from_task(resp_task: Task) -> list[Any]:
 def _negotiate_sorted_history(
     max_attempts: int = MAX_NEGOTIATION_ATTEMPTS,
 ) -> int:
-    """Ask Carol to shuffle until the history list is sorted.
+    """Ask Carol to sort the history list and confirm the result.
 
-    The function starts a new *shuffle* task, then enters a request/response
-    loop sending either “Try again” or “Well done!” follow-ups depending on
-    whether the returned list is sorted.
+    The function starts a new *shuffle* task, whose reply Carol sorts by
+    guess, then enters a request/response loop sending either “Try again” or
+    “Well done!” follow-ups depending on whether the returned list is sorted.
+    With a sorted reply the loop ends after a single “Well done!”.
 
     Args:
         max_attempts: Upper bound on the number of reshuffle attempts before the
@@ -100,13 +101,10 @@ def _negotiate_sorted_history(
             game_history.clear()
             game_history.extend(maybe_hist)
             print(f'[Bob] History is sorted after {attempts} attempt(s)')
-            print(
-                '(We do sorting by random to illustrate multi-turn communication)'
-            )
             resp_task = send_followup(AGENT_CAROL_PORT, resp_task, 'Well done!')  # type: ignore[assignment]
             break
 
-        # Not sorted → ask Carol to shuffle again
+        # Not sorted → ask Carol to try again
         attempts += 1
         print(f"[Bob] Attempt {attempts}: sending 'Try again'")
         resp_obj = send_followup(AGENT_CAROL_PORT, resp_task, 'Try again')
@@ -3,12 +3,11 @@ AgentCarol – helper agent that visualises or shuffles Bob's guess history.
 
 Carol receives plain-text JSON payloads from AgentBob and returns either
 (1) a human-readable table of the guesses so far or (2) a JSON list with
-entries randomly shuffled, depending on the request.  This functionality
+entries sorted by guess, depending on the request.  This functionality
 is intentionally simple to keep the focus on A2A message flow.
 """
 
 import json
-import random
 import uuid
 
 from typing import Any
@@ -21,7 +20,7 @@ from a2a.types import AgentCard, Part, TextPart
 from a2a.utils.message import get_message_text
 from config import AGENT_CAROL_PORT
 from utils import try_parse_json
-from utils.game_logic import process_history_payload
+from utils.game_logic import process_history_payload, sort_history
 from utils.server import run_agent_blocking
 
 
@@ -40,7 +39,7 @@ carol_skills = [
     {
         'id': 'history_shuffler',
         'name': 'Guess History Shuffler',
-        'description': 'Randomly shuffles the order of guess/response entries in a provided history list and returns JSON.',
+        'description': 'Sorts the guess/response entries in a provided history list by guess and returns JSON.',
         'tags': ['shuffling', 'demo'],
         'inputModes': ['text/plain'],
         'outputModes': ['text/plain'],
@@ -85,8 +84,10 @@ class HistoryHelperExecutor(AgentExecutor):
         print(f'[Carol] {label}: {guesses}')
 
     def __init__(self) -> None:
-        # Keep the last history list so we can reshuffle it on follow-up.
-        self._last_history: list[dict[str, Any]] = []
+        # History list of each open shuffle task, keyed by task ID, so we can
+        # return it again on follow-up. Several tasks can be open at once, so
+        # they must not share one list; entries go when the task ends.
+        self._histories: dict[str, list[dict[str, Any]]] = {}
 
     # ------------------------------------------------------------------
     # Internal helper methods
@@ -109,15 +110,17 @@ class HistoryHelperExecutor(AgentExecutor):
 
         if raw_text.lower().startswith('well done'):
             print('[Carol] Received well done – completing task')
+            self._histories.pop(task_id, None)
             await updater.complete()
             return
 
-        # Any other text → shuffle again and ask for more input
-        print('[Carol] Shuffling again and returning list')
-        random.shuffle(self._last_history)
+        # Any other text → sort again and ask for more input
+        print('[Carol] Sorting again and returning list')
+        history = self._histories.setdefault(task_id, [])
+        sort_history(history)
         # Debug print before sending back to Bob
-        self._print_guesses('Shuffled list', self._last_history)
-        response_text = json.dumps(self._last_history)
+        self._print_guesses('Sorted list', history)
+        response_text = json.dumps(history)
         await updater.add_artifact([Part(root=TextPart(text=response_text))])
         # Ask for another input and signal that this is the last event for this invocation
         await updater.requires_input(final=True)
@@ -130,7 +133,9 @@ class HistoryHelperExecutor(AgentExecutor):
             process_history_payload(raw_text) if raw_text else 'Invalid input.'
         )
 
-        # Remember history list if provided so we can shuffle again later
+        task_id = context.task_id or str(uuid.uuid4())
+
+        # Remember history list if provided so we can sort again later
         success, parsed = try_parse_json(raw_text)
         if (
             success
@@ -139,9 +144,8 @@ class HistoryHelperExecutor(AgentExecutor):
         ):
             hist = parsed.get('history', [])
             if isinstance(hist, list):
-                self._last_history = hist
+                self._histories[task_id] = hist
 
-        task_id = context.task_id or str(uuid.uuid4())
         updater = TaskUpdater(
             event_queue,
             task_id=task_id,
@@ -152,7 +156,9 @@ class HistoryHelperExecutor(AgentExecutor):
             if success and isinstance(parsed, list):
                 self._print_guesses('Initial list', parsed)
             else:
-                self._print_guesses('Initial list', self._last_history)
+                self._print_guesses(
+                    'Initial list', self._histories.get(task_id, [])
+                )
         except Exception:
             pass
         await updater.add_artifact([Part(root=TextPart(text=response_text))])
@@ -185,6 +191,7 @@ class HistoryHelperExecutor(AgentExecutor):
             print(
                 f'[Carol] Task {context.task_id} canceled on request of peer agent'
             )
+            self._histories.pop(context.task_id, None)
             updater = TaskUpdater(
                 event_queue,
                 task_id=context.task_id,
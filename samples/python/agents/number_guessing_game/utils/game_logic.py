@@ -3,8 +3,8 @@ Game mechanics shared by the toy number-guessing demo.
 
 This module is transport-agnostic. It currently contains:
 * Number-guess evaluation for Agent Alice (`process_guess`).
-* History visualisation and shuffle helpers for Agent Carol
-  (`build_visualisation`, `process_history_payload`).
+* History visualisation and sorting helpers for Agent Carol
+  (`build_visualisation`, `process_history_payload`, `sort_history`).
 """
 
 from __future__ import annotations
@@ -20,6 +20,7 @@ __all__ = [
     'is_sorted_history',
     'process_guess',
     'process_history_payload',
+    'sort_history',
 ]
 
 # ---------------------------------------------------------------------------
@@ -116,26 +117,44 @@ def is_sorted_history(history: list[dict[str, str]]) -> bool:
         bool: ``True`` when values are in non-decreasing order; ``False``
         otherwise or on parse errors.
     """
-    # The history list can contain either dict entries (with a 'guess' key)
-    # or bare numeric values when other agents reply with a simplified list.
     try:
-        if history and isinstance(history[0], dict):
-            guesses = [int(entry['guess']) for entry in history]
-        else:
-            # Assume iterable of plain numbers / numeric strings
-            guesses = [int(entry) for entry in history]
+        guesses = [_guess_value(entry) for entry in history]
     except (ValueError, TypeError, KeyError):
         return False
     return guesses == sorted(guesses)
 
 
+def sort_history(history: list[dict[str, str]]) -> None:
+    """Sort *history* in place in ascending order by the guess.
+
+    Accepts the same entry shapes as :func:`is_sorted_history`. When a guess
+    cannot be parsed the list is left unchanged.
+
+    Args:
+        history: List of dictionaries **or** plain numbers representing the
+            guessed value.
+    """
+    try:
+        history.sort(key=_guess_value)
+    except (ValueError, TypeError, KeyError):
+        pass
+
+
+def _guess_value(entry: dict[str, str] | int | str) -> int:
+    # The history list can contain either dict entries (with a 'guess' key)
+    # or bare numeric values when other agents reply with a simplified list.
+    if isinstance(entry, dict):
+        return int(entry['guess'])
+    return int(entry)
+
+
 def process_history_payload(raw_text: str) -> str:
     """Return Agent Carol's response for the supplied payload.
 
     The interpretation depends on the JSON structure:
 
     1. ``{"action": "shuffle", "history": [...]}`` – The history list is
-       shuffled in place and returned as a JSON string.
+       sorted by guess in place and returned as a JSON string.
     2. ``[ ... ]`` – The list is treated as a full history and formatted via
        :func:`build_visualisation`.
 
@@ -158,8 +177,9 @@ def process_history_payload(raw_text: str) -> str:
         history_list = parsed.get('history', [])
         if not isinstance(history_list, list):
             history_list = []
-        random.shuffle(history_list)
-        print('[GameLogic] Shuffled history and returned JSON list')
+        # Sort directly: shuffling until sorted takes O(n!) attempts
+        sort_history(history_list)
+        print('[GameLogic] Sorted history and returned JSON list')
         return json.dumps(history_list)
 
     # Visualisation request
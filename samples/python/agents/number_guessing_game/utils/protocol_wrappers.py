@@ -6,9 +6,15 @@ business logic.
 from __future__ import annotations
 
 import asyncio
+import threading
 import uuid
 
-from a2a.client import ClientConfig, ClientFactory, minimal_agent_card
+from a2a.client import (
+    Client,
+    ClientConfig,
+    ClientFactory,
+    minimal_agent_card,
+)
 from a2a.client.client_task_manager import ClientTaskManager
 from a2a.types import Message, Role, Task, TaskIdParams, TextPart
 from a2a.utils.message import get_message_text
@@ -30,6 +36,42 @@ __all__ = [
 
 _client_factory = ClientFactory(ClientConfig())
 
+# The synchronous helpers below run their coroutines on one long-lived event
+# loop owned by a daemon thread, instead of creating and tearing down a fresh
+# loop (via ``asyncio.run``) for every message.
+_loop = asyncio.new_event_loop()
+threading.Thread(
+    target=_loop.run_forever, name='a2a-client-loop', daemon=True
+).start()
+
+
+def _run(coro):
+    """Run *coro* on the background loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+# One client per target port, so repeated messages reuse its HTTP connections.
+# The pooled connections belong to the loop that opened them, so the cache is
+# only used on the background loop above, which lives as long as the process.
+_clients: dict[int, Client] = {}
+
+
+def _get_client(port: int) -> Client:
+    if asyncio.get_running_loop() is _loop:
+        client = _clients.get(port)
+        if client is None:
+            client = _clients[port] = _new_client(port)
+        return client
+    # Awaited directly on the caller's own loop (e.g. via ``asyncio.run``),
+    # which may be closed by the next call: use a fresh client, not the cache.
+    return _new_client(port)
+
+
+def _new_client(port: int) -> Client:
+    return _client_factory.create(
+        minimal_agent_card(f'http://localhost:{port}/a2a/v1')
+    )
+
 
 async def send_text_async(
     port: int,
@@ -52,9 +94,7 @@ async def send_text_async(
         Union[Task, Message]: The final object produced by the agent—normally a
         ``Task`` but may be a plain ``Message`` for very small interactions.
     """
-    client = _client_factory.create(
-        minimal_agent_card(f'http://localhost:{port}/a2a/v1')
-    )
+    client = _get_client(port)
     msg = Message(
         kind='message',
         role=Role.user,
@@ -95,9 +135,9 @@ def send_text(
 ):
     """Synchronous helper that delegates to :func:`send_text_async`.
 
-    The helper transparently detects whether the caller is already running
-    inside an event loop (e.g. inside a Jupyter notebook or another async
-    framework) and chooses the appropriate execution strategy.
+    The coroutine runs on the module's background event loop, so the helper
+    works the same whether or not the caller is already inside an event loop
+    (e.g. inside a Jupyter notebook or another async framework).
 
     Args:
         port: TCP port where the target agent is listening.
@@ -109,30 +149,15 @@ def send_text(
     Returns:
         Union[Task, Message]: See :func:`send_text_async`.
     """
-    try:
-        return asyncio.run(
-            send_text_async(
-                port,
-                text,
-                context_id=context_id,
-                reference_task_ids=reference_task_ids,
-                task_id=task_id,
-            )
+    return _run(
+        send_text_async(
+            port,
+            text,
+            context_id=context_id,
+            reference_task_ids=reference_task_ids,
+            task_id=task_id,
         )
-    except RuntimeError:
-        # Fallback when called from within an existing running loop (e.g. Jupyter)
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            return loop.run_until_complete(
-                send_text_async(
-                    port,
-                    text,
-                    context_id=context_id,
-                    reference_task_ids=reference_task_ids,
-                    task_id=task_id,
-                )
-            )
-        raise
+    )
 
 
 def send_followup(
@@ -172,30 +197,21 @@ def send_followup(
 
 
 async def _cancel_task_async(port: int, task_id: str) -> None:
-    client = _client_factory.create(
-        minimal_agent_card(f'http://localhost:{port}/a2a/v1')
-    )
+    client = _get_client(port)
     await client.cancel_task(TaskIdParams(id=task_id))
 
 
 def cancel_task(port: int, task_id: str) -> None:
     """Synchronously request cancellation of *task_id* on the remote agent.
 
-    The wrapper executes :func:`_cancel_task_async` while handling the common
-    case where the caller might already sit inside an event loop.
+    The wrapper executes :func:`_cancel_task_async` on the module's background
+    event loop, so it is safe to call even from inside another event loop.
 
     Args:
         port: TCP port where the target agent is reachable.
         task_id: Identifier of the task to cancel.
     """
-    try:
-        asyncio.run(_cancel_task_async(port, task_id))
-    except RuntimeError:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            loop.run_until_complete(_cancel_task_async(port, task_id))
-        else:
-            raise
+    _run(_cancel_task_async(port, task_id))
 
 
 # ---------------------------------------------------------------------------